@@ -11,7 +11,13 @@ from __future__ import annotations
 from .src.x_make_telemetry_vector_x import (
     DEFAULT_TELEMETRY_VERSION,
     TelemetryEvent,
+    normalize_batch,
     normalize_payload,
 )
 
-__all__ = ["DEFAULT_TELEMETRY_VERSION", "TelemetryEvent", "normalize_payload"]
+__all__ = [
+    "DEFAULT_TELEMETRY_VERSION",
+    "TelemetryEvent",
+    "normalize_batch",
+    "normalize_payload",
+]
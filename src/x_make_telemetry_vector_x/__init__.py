@@ -7,7 +7,8 @@ re-writing the same coercion logic.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Literal, ParamSpec, TypedDict, TypeVar, cast
 
@@ -16,6 +17,14 @@ from typing_extensions import Unpack
 
 DEFAULT_TELEMETRY_VERSION = "0.1.0"
 UTC = timezone.utc  # noqa: UP017 - Python 3.10 compatibility
+# printf-style formatting is a single C call, measurably cheaper than the
+# equivalent f-string or isoformat().replace() chain.
+_ISO_Z_FORMAT = "%04d-%02d-%02dT%02d:%02d:%02dZ"
+_ISO_Z_MICRO_FORMAT = "%04d-%02d-%02dT%02d:%02d:%02d.%06dZ"
+_EMPTY_EID_MSG = "event_id may not be empty"
+_EMPTY_SA_MSG = "source/action cannot be blank"
+_NON_STRING_MSG = "Telemetry event id, source, and action must be strings"
+_NONE_VERSION_MSG = "telemetry_version must be a string, not None"
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -39,10 +48,75 @@ def _object_dict() -> dict[str, object]:
     return {}
 
 
+def _ensure_utc(dt: datetime, *, _UTC: timezone = UTC) -> datetime:  # noqa: N803
+    """Return ``dt`` in UTC, treating naive values as already being UTC."""
+    tzinfo = dt.tzinfo
+    if tzinfo is None:
+        return dt.replace(tzinfo=_UTC)
+    if tzinfo is _UTC:
+        return dt
+    return dt.astimezone(_UTC)
+
+
+def _iso_z(dt: datetime) -> str:
+    """Format a UTC-aware datetime as ISO 8601 with a ``Z`` suffix.
+
+    Callers must pass a datetime already converted by :func:`_ensure_utc`; the
+    offset is not inspected.
+    """
+    microsecond = dt.microsecond
+    if microsecond:
+        return _ISO_Z_MICRO_FORMAT % (
+            dt.year,
+            dt.month,
+            dt.day,
+            dt.hour,
+            dt.minute,
+            dt.second,
+            microsecond,
+        )
+    return _ISO_Z_FORMAT % (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+
+
+def _parse_ts(value: object, *, _UTC: timezone = UTC) -> datetime:  # noqa: N803
+    """Coerce a raw timestamp into a UTC-aware datetime outside Pydantic.
+
+    ISO strings are by far the most common input, so they are checked first
+    with an exact type test before falling back to datetimes and epoch seconds.
+    ``_UTC`` is bound as a default so the hot path reads it as a local.
+    """
+    if type(value) is str:
+        if not value.endswith("Z"):
+            return _ensure_utc(datetime.fromisoformat(value))
+        parsed = datetime.fromisoformat(value[:-1])
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=_UTC)
+        msg = f"Unsupported timestamp value: {value!r}"
+        raise ValueError(msg)
+    if isinstance(value, datetime):
+        return _ensure_utc(value)
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=_UTC)
+    if isinstance(value, str):
+        return _parse_ts(str(value))
+    msg = f"Unsupported timestamp value: {value!r}"
+    raise ValueError(msg)
+
+
 class TelemetryEvent(BaseModel):
     """Pydantic model describing the canonical telemetry envelope."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
+    # Spelled out so the per-instance cost stays pinned: no revalidation of
+    # nested instances, no assignment validation, and the core schema is built
+    # eagerly at class creation rather than on first use.
+    model_config = ConfigDict(
+        populate_by_name=True,
+        extra="allow",
+        revalidate_instances="never",
+        validate_assignment=False,
+        frozen=False,
+        defer_build=False,
+    )
 
     event_id: str = Field(alias="id")
     source: str
@@ -54,97 +128,199 @@ class TelemetryEvent(BaseModel):
     @typed_field_validator("timestamp", mode="before")
     @classmethod
     def _coerce_timestamp(cls, value: object) -> datetime:
-        """Accept string, epoch seconds, or datetime and return UTC-aware timestamp."""
-        if isinstance(value, datetime):
-            return value if value.tzinfo else value.replace(tzinfo=UTC)
-        if isinstance(value, (int, float)):
-            return datetime.fromtimestamp(value, tz=UTC)
-        if isinstance(value, str):
-            iso_value = value.replace("Z", "+00:00")
-            parsed = datetime.fromisoformat(iso_value)
-            if parsed.tzinfo is None:
-                return parsed.replace(tzinfo=UTC)
-            return parsed.astimezone(UTC)
-        msg = f"Unsupported timestamp value: {value!r}"
-        raise ValueError(msg)
+        """Accept string, epoch seconds, or datetime and return UTC-aware timestamp.
+
+        Only :meth:`model_validate` callers go through here; the trusted path in
+        :func:`normalize_payload` calls :func:`_parse_ts` directly.
+        """
+        return _parse_ts(value)
 
     @typed_field_validator("event_id")
     @classmethod
     def _strip_event_id(cls, value: str) -> str:
         clean = value.strip()
-        if not clean:
-            msg = "event_id may not be empty"
-            raise ValueError(msg)
-        return clean
+        if clean:
+            return clean
+        raise ValueError(_EMPTY_EID_MSG)
 
     @typed_field_validator("source", "action")
     @classmethod
     def _strip_required_fields(cls, value: str) -> str:
         clean = value.strip()
-        if not clean:
-            msg = "source/action cannot be blank"
-            raise ValueError(msg)
-        return clean
+        if clean:
+            return clean
+        raise ValueError(_EMPTY_SA_MSG)
 
 
-def _ensure_utc(dt: datetime) -> datetime:
-    return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
+@dataclass(slots=True)
+class _FastTelemetryEvent:
+    """Validator-free mirror of :class:`TelemetryEvent` for trusted producers.
+
+    The string and timestamp coercions run inline in :meth:`from_event`, so
+    trusted events never cross into pydantic-core. ``payload`` and ``metadata``
+    are aliased rather than copied.
+    """
+
+    event_id: str
+    source: str
+    action: str
+    timestamp: datetime
+    payload: dict[str, object]
+    metadata: dict[str, object]
+
+    @classmethod
+    def from_event(cls, event: Mapping[str, object]) -> _FastTelemetryEvent:
+        """Build from a raw event, raising ``ValueError`` like the validator.
+
+        Accepts ``event_id`` in place of ``id``, matching ``populate_by_name``.
+        """
+        try:
+            raw_id = event["id"] if "id" in event else event["event_id"]
+            raw_source = event["source"]
+            raw_action = event["action"]
+            raw_timestamp = event["timestamp"]
+        except KeyError as exc:
+            msg = f"Telemetry event is missing required field {exc.args[0]!r}"
+            raise ValueError(msg) from exc
+        if not (
+            isinstance(raw_id, str)
+            and isinstance(raw_source, str)
+            and isinstance(raw_action, str)
+        ):
+            raise ValueError(_NON_STRING_MSG)  # noqa: TRY004 - match validated path
+        event_id = raw_id.strip()
+        source = raw_source.strip()
+        action = raw_action.strip()
+        if not event_id:
+            raise ValueError(_EMPTY_EID_MSG)
+        if not source or not action:
+            raise ValueError(_EMPTY_SA_MSG)
+        payload = event.get("payload")
+        if payload is None:
+            payload = {}
+        metadata = event.get("metadata")
+        if metadata is None:
+            metadata = {}
+        return cls(
+            event_id,
+            source,
+            action,
+            _parse_ts(raw_timestamp),
+            cast("dict[str, object]", payload),
+            cast("dict[str, object]", metadata),
+        )
+
+
+# Resolved once at import so the per-event path skips two attribute lookups.
+_VALIDATE = TelemetryEvent.model_validate
+_FROM_TRUSTED = _FastTelemetryEvent.from_event
+
+
+def _normalize_with_now(
+    event: Mapping[str, object] | object,
+    telemetry_version: str,
+    ingested_at: str,
+    *,
+    trusted: bool,
+) -> dict[str, object]:
+    """Build the envelope for ``event`` using a pre-formatted ``ingested_at``."""
+    if type(event) is not dict and not isinstance(event, Mapping):
+        msg = "Telemetry event payload must be a mapping"
+        raise TypeError(msg)
+
+    model: TelemetryEvent | _FastTelemetryEvent
+    if trusted:
+        model = _FROM_TRUSTED(event)
+    else:
+        try:
+            model = _VALIDATE(event)
+        except ValidationError as exc:  # pragma: no cover - provide stable error type
+            raise ValueError(str(exc)) from exc
+
+    return {
+        "telemetry_version": telemetry_version,
+        "event_id": model.event_id,
+        "source": model.source,
+        "action": model.action,
+        "timestamp": _iso_z(model.timestamp),
+        "ingested_at": ingested_at,
+        "payload": model.payload,
+        "metadata": model.metadata,
+    }
 
 
 def normalize_payload(
     event: Mapping[str, object] | object,
     *,
-    telemetry_version: str | None = None,
+    telemetry_version: str = DEFAULT_TELEMETRY_VERSION,
     ingested_at: datetime | None = None,
+    trusted: bool = False,
 ) -> dict[str, object]:
     """Normalise a raw telemetry payload into the canonical envelope.
 
     Parameters
     ----------
     event:
-        Mapping containing raw telemetry data. Must include ``id``, ``source``,
-        ``action``, and ``timestamp``.
+        Mapping containing raw telemetry data. Must include ``id`` (or
+        ``event_id``), ``source``, ``action``, and ``timestamp``.
     telemetry_version:
-        Optional version string to embed in the envelope. Defaults to
-        :data:`DEFAULT_TELEMETRY_VERSION`.
+        Version string to embed in the envelope, used verbatim (an empty
+        string stays empty). Defaults to :data:`DEFAULT_TELEMETRY_VERSION`;
+        ``None`` raises ``TypeError`` rather than silently embedding ``null``.
     ingested_at:
         Optional datetime describing when the event entered the pipeline. If not
         supplied the current UTC time is used.
+    trusted:
+        Skip Pydantic validation for producers that already emit well-formed
+        envelopes. The timestamp is coerced and ``event_id``/``source``/
+        ``action`` are stripped and checked for blanks; missing or non-string
+        fields still raise ``ValueError``. Payload types are not checked and
+        any invariant added to :class:`TelemetryEvent` later
+        is bypassed, so never pass untrusted input with ``trusted=True``.
+        The returned ``payload`` and ``metadata`` are the caller's own
+        objects, not copies, so mutating one side is visible on the other;
+        only a missing or ``None`` value is replaced with a fresh ``{}``, and
+        non-dict values pass through unchanged.
     """
 
-    if not isinstance(event, Mapping):
-        msg = "Telemetry event payload must be a mapping"
-        raise TypeError(msg)
-
-    try:
-        model: TelemetryEvent = TelemetryEvent.model_validate(event)
-    except ValidationError as exc:  # pragma: no cover - provide stable error type
-        raise ValueError(str(exc)) from exc
-
+    if telemetry_version is None:
+        raise TypeError(_NONE_VERSION_MSG)
     normalized_ingested_at = (
         _ensure_utc(ingested_at) if ingested_at else datetime.now(tz=UTC)
     )
-    return {
-        "telemetry_version": telemetry_version or DEFAULT_TELEMETRY_VERSION,
-        "event_id": model.event_id,
-        "source": model.source,
-        "action": model.action,
-        "timestamp": model.timestamp.astimezone(UTC)
-        .isoformat()
-        .replace(
-            "+00:00",
-            "Z",
-        ),
-        "ingested_at": normalized_ingested_at.astimezone(UTC)
-        .isoformat()
-        .replace("+00:00", "Z"),
-        "payload": model.payload,
-        "metadata": model.metadata,
-    }
+    return _normalize_with_now(
+        event,
+        telemetry_version,
+        _iso_z(normalized_ingested_at),
+        trusted=trusted,
+    )
+
+
+def normalize_batch(
+    events: Iterable[Mapping[str, object]],
+    *,
+    telemetry_version: str = DEFAULT_TELEMETRY_VERSION,
+    trusted: bool = False,
+) -> list[dict[str, object]]:
+    """Normalise a batch of raw telemetry payloads sharing one ingestion time.
+
+    The clock is read and formatted once for the whole batch, so every envelope
+    carries the same ``ingested_at``. See :func:`normalize_payload` for the
+    meaning of ``telemetry_version`` and ``trusted``.
+    """
+
+    if telemetry_version is None:
+        raise TypeError(_NONE_VERSION_MSG)
+    ingested_at = _iso_z(datetime.now(tz=UTC))
+    return [
+        _normalize_with_now(event, telemetry_version, ingested_at, trusted=trusted)
+        for event in events
+    ]
 
 
 __all__ = [
     "DEFAULT_TELEMETRY_VERSION",
     "TelemetryEvent",
+    "normalize_batch",
     "normalize_payload",
 ]
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from x_make_telemetry_vector_x import (
     DEFAULT_TELEMETRY_VERSION,
     TelemetryEvent,
+    normalize_batch,
     normalize_payload,
 )
 
@@ -71,6 +72,148 @@ def test_normalize_payload_supports_naive_datetime() -> None:
     assert normalized["ingested_at"] == "2025-11-12T08:45:00Z"
 
 
+def test_normalize_payload_trusted_matches_validated_path() -> None:
+    ingested_at = datetime(
+        2025,
+        11,
+        12,
+        9,
+        0,
+        0,
+        tzinfo=timezone.utc,  # noqa: UP017 - Python 3.10 compatibility
+    )
+    event = {
+        "id": "abc-123",
+        "source": "github_clones",
+        "action": "clone",
+        "timestamp": "2025-11-12T10:30:00Z",
+        "payload": {"foo": "bar"},
+        "metadata": {"observer": "navarro"},
+    }
+
+    trusted = normalize_payload(event, ingested_at=ingested_at, trusted=True)
+    validated = normalize_payload(event, ingested_at=ingested_at)
+
+    assert trusted == validated
+    assert trusted["payload"] is event["payload"]
+
+    empty: dict[str, object] = {}
+    aliased = normalize_payload({**event, "metadata": empty}, trusted=True)
+    assert aliased["metadata"] is empty
+
+
+def test_normalize_payload_trusted_strips_and_rejects_blanks() -> None:
+    event = {
+        "id": "  padded  ",
+        "source": " lab ",
+        "action": "emit",
+        "timestamp": "2025-11-12T08:45:00Z",
+    }
+
+    normalized = normalize_payload(event, trusted=True)
+    assert normalized["event_id"] == "padded"
+    assert normalized["source"] == "lab"
+    assert normalized["payload"] == {}
+
+    with pytest.raises(ValueError, match="source/action cannot be blank"):
+        normalize_payload({**event, "action": " "}, trusted=True)
+
+
+def test_normalize_payload_trusted_accepts_event_id_key() -> None:
+    event = {
+        "event_id": "by-name",
+        "source": "lab",
+        "action": "emit",
+        "timestamp": "2025-11-12T08:45:00Z",
+    }
+
+    trusted = normalize_payload(event, trusted=True)
+    validated = normalize_payload(event)
+    assert trusted["event_id"] == validated["event_id"] == "by-name"
+
+
+def test_normalize_payload_trusted_raises_value_error_for_bad_fields() -> None:
+    event = {
+        "source": "lab",
+        "action": "emit",
+        "timestamp": "2025-11-12T08:45:00Z",
+    }
+
+    with pytest.raises(ValueError, match="missing required field 'event_id'"):
+        normalize_payload(event, trusted=True)
+
+    with pytest.raises(ValueError, match="must be strings"):
+        normalize_batch([{**event, "id": 42}], trusted=True)
+
+    with pytest.raises(ValueError, match="must be strings"):
+        normalize_payload({**event, "id": b" bb "}, trusted=True)
+
+
+def test_normalize_payload_converts_offsets_to_utc() -> None:
+    ingested_at = datetime(
+        2025,
+        11,
+        12,
+        12,
+        0,
+        0,
+        250,
+        tzinfo=timezone(timedelta(hours=2)),
+    )
+    event = {
+        "id": "offset",
+        "source": "lab",
+        "action": "emit",
+        "timestamp": "2025-11-12T10:30:00-05:00",
+    }
+
+    normalized = normalize_payload(event, ingested_at=ingested_at)
+    assert normalized["timestamp"] == "2025-11-12T15:30:00Z"
+    assert normalized["ingested_at"] == "2025-11-12T10:00:00.000250Z"
+
+
+def test_normalize_batch_shares_ingested_at() -> None:
+    events: list[dict[str, object]] = [
+        {
+            "id": "first",
+            "source": "lab",
+            "action": "emit",
+            "timestamp": "2025-11-12T08:45:00Z",
+        },
+        {
+            "id": "second",
+            "source": "lab",
+            "action": "emit",
+            "timestamp": 1_700_000_000,
+            "payload": {"foo": "bar"},
+        },
+    ]
+
+    normalized = normalize_batch(events, telemetry_version="custom")
+
+    assert [item["event_id"] for item in normalized] == ["first", "second"]
+    assert normalized[0]["ingested_at"] == normalized[1]["ingested_at"]
+    assert normalized[1]["timestamp"] == "2023-11-14T22:13:20Z"
+    assert {item["telemetry_version"] for item in normalized} == {"custom"}
+
+
+def test_normalize_payload_keeps_empty_telemetry_version() -> None:
+    event = {
+        "id": "versioned",
+        "source": "lab",
+        "action": "emit",
+        "timestamp": "2025-11-12T08:45:00Z",
+    }
+
+    assert normalize_payload(event, telemetry_version="")["telemetry_version"] == ""
+
+    with pytest.raises(TypeError, match="telemetry_version must be a string"):
+        normalize_payload(event, telemetry_version=None)  # type: ignore[arg-type]
+
+    with pytest.raises(TypeError, match="telemetry_version must be a string"):
+        normalize_batch([event], telemetry_version=None)  # type: ignore[arg-type]
+
+
 def test_normalize_payload_rejects_bad_timestamp() -> None:
     event = {
         "id": "bad",